@@ -8,6 +8,21 @@ from . import _lz4 as lz4
 LOG_BLOCKS = False
 LZ4_VERBOSE = False
 
+# Precompiled structs for the blocks that get read once per vert / tri (vert),
+#  so the format strings don't need to be looked up for every block
+_INT16 = struct.Struct('h')
+_UINT16 = struct.Struct('H')
+_INT32 = struct.Struct('i')
+_FLOAT = struct.Struct('f')
+_VEC2 = struct.Struct('ff')
+_VEC3 = struct.Struct('fff')
+_VEC4 = struct.Struct('ffff')
+_SHORT_VEC3 = struct.Struct('hhh')
+_VERTEX_WEIGHT = struct.Struct('=hf')
+_TRIANGLE = struct.Struct('BB')
+_TRIANGLE16 = struct.Struct('HH')
+_COLOR = struct.Struct('BBBB')
+
 __LZ4_DISPLAY_SUPPORT_INFO__ = True
 
 
@@ -148,19 +163,16 @@ class XBlock(object):
 
 	@staticmethod
 	def LoadInt16Block(file):
-		data = file.read(2)
-		return struct.unpack('h', data)[0]
+		return _INT16.unpack(file.read(2))[0]
 
 	@staticmethod
 	def LoadUInt16Block(file):
-		data = file.read(2)
-		return struct.unpack('H', data)[0]
+		return _UINT16.unpack(file.read(2))[0]
 
 	@staticmethod
 	def LoadInt32Block(file):
-		file.seek(file.tell() + 2)
-		data = file.read(4)
-		return struct.unpack('i', data)[0]
+		file.read(2)  # Skip padding
+		return _INT32.unpack(file.read(4))[0]
 
 	@staticmethod
 	def LoadCommentBlock(file):
@@ -180,83 +192,61 @@ class XBlock(object):
 		file.seek(start + padded(file.tell() - start))
 		return result
 
+	# The fixed size blocks below already end on a 4 byte boundary, so they
+	#  only need to skip the 2 bytes of padding after the block hash
 	@staticmethod
 	def LoadFloatBlock(file):
-		start = file.tell() - 2
-		file.seek(start + 4)
-		data = file.read(4)
-		result = struct.unpack('f', data)[0]
-		file.seek(start + padded(file.tell() - start))
-		return result
+		file.read(2)  # Skip padding
+		return _FLOAT.unpack(file.read(4))[0]
 
 	@staticmethod
 	def LoadVec2Block(file):
-		start = file.tell() - 2
-		file.seek(start + 4)
-		data = file.read(8)
-		result = struct.unpack('ff', data)
-		file.seek(start + padded(file.tell() - start))
-		return result
+		file.read(2)  # Skip padding
+		return _VEC2.unpack(file.read(8))
 
 	@staticmethod
 	def LoadVec3Block(file):
-		start = file.tell() - 2
-		file.seek(start + 4)
-		data = file.read(12)
-		result = struct.unpack('fff', data)
-		file.seek(start + padded(file.tell() - start))
-		return result
+		file.read(2)  # Skip padding
+		return _VEC3.unpack(file.read(12))
 
 	@staticmethod
 	def LoadShortVec3Block(file):
-		data = file.read(6)
-		x, y, z = struct.unpack('hhh', data)
+		x, y, z = _SHORT_VEC3.unpack(file.read(6))
 		return (x / 32767.0, y / 32767.0, z / 32767.0)
 
 	@staticmethod
 	def LoadVec4Block(file):
-		start = file.tell() - 2
-		file.seek(start + 4)
-		data = file.read(16)
-		result = struct.unpack('ffff', data)
-		file.seek(start + padded(file.tell() - start))
-		return result
+		file.read(2)  # Skip padding
+		return _VEC4.unpack(file.read(16))
 
 	@staticmethod
 	def LoadVertexWeightBlock(file):
-		data = file.read(6)
-		result = struct.unpack('=hf', data)
-		return result
+		return _VERTEX_WEIGHT.unpack(file.read(6))
 
 	@staticmethod
 	def LoadTriangleBlock(file):
-		data = file.read(2)
-		result = struct.unpack('BB', data)
-		return result
+		return _TRIANGLE.unpack(file.read(2))
 
 	@staticmethod
 	def LoadTriangle16Block(file):
-		file.seek(file.tell() + 2)  # Skip padding
-		data = file.read(4)
-		result = struct.unpack('HH', data)
-		return result
+		file.read(2)  # Skip padding
+		return _TRIANGLE16.unpack(file.read(4))
 
 	@staticmethod
 	def LoadColorBlock(file):
-		file.seek(file.tell() + 2)  # Skip padding
-		data = file.read(4)
-		r, g, b, a = struct.unpack('BBBB', data)
+		file.read(2)  # Skip padding
+		r, g, b, a = _COLOR.unpack(file.read(4))
 		return (r / 255.0, g / 255.0, b / 255.0, a / 255.0)
 
 	@staticmethod
 	def LoadUVBlock(file):
-		data = file.read(2)
-		layer_count = struct.unpack('h', data)[0]
+		layer_count = _INT16.unpack(file.read(2))[0]
 		data = file.read(8 * layer_count)
-		result = struct.unpack( f"{layer_count * 2}f", data )
+		if layer_count == 0:
+			return ()
 		# Technically there is support for additional UV layers
 		#  but we're only using the first one at the moment
-		return result[ :2 ]
+		return _VEC2.unpack_from(data)
 
 	@staticmethod
 	def LoadObjectBlock(file):
@@ -911,23 +901,27 @@ class XBinIO(object):
 		}
 
 		# Read all blocks
-		data = file.read(2)
+		read = file.read
+		unpack_hash = _UINT16.unpack
+		data = read(2)
 		while data:
-			block_hash = struct.unpack('H', data)[0]
-			if block_hash in hashmap:
-				offset = file.tell()
-				data = hashmap[block_hash]
-				if data[1] is None:
-					raise NotImplementedError( f"Unimplemented Block '{data[0]}' at 0x{offset}" )
+			block_hash = unpack_hash(data)[0]
+			block = hashmap.get(block_hash)
+			if block is not None:
+				name, loader = block
+				if loader is None:
+					offset = file.tell()
+					raise NotImplementedError( f"Unimplemented Block '{name}' at 0x{offset}" )
+				elif LOG_BLOCKS:
+					offset = file.tell()
+					print( f"Loading Block: '{name}' at 0x{offset}" )
+					val = loader(file)
+					print( f"\tData: {repr(val)}" )
 				else:
-					if LOG_BLOCKS:
-						print( f"Loading Block: '{data[0]}' at 0x{offset}" )
-					val = data[1](file)
-					if LOG_BLOCKS:
-						print( f"\tData: {repr(val)}" )
+					loader(file)
 
 				# Read the next block hash
-				data = file.read(2)
+				data = read(2)
 			else:
 				offset = file.tell() - 2
 				raise ValueError( f"Unknown Block Hash 0x{block_hash} at 0x{offset}" )
@@ -183,6 +183,20 @@ class BlenderCoD_Preferences( AddonPreferences ):
 		default = true
 	) # type: ignore
 
+	use_bmesh_import: BoolProperty(
+		name = "Use BMesh XModel Importer",
+		description = "Build imported XModel meshes with bmesh instead of filling the mesh data directly "
+					  "(slower - only use this if imported meshes come out broken)",
+		default = false
+	) # type: ignore
+
+	use_import_cache: BoolProperty(
+		name = "Cache Imported XModels",
+		description = "Save a .cache.blend (& .cache.blend.key) file next to each imported XModel, and load it instead of "
+					  "re-importing the XModel the next time it's imported with the same settings",
+		default = false
+	) # type: ignore
+
 	def draw(self, context):
 		layout = self.layout
 
@@ -209,6 +223,9 @@ class BlenderCoD_Preferences( AddonPreferences ):
 		sub.enabled = self.unit_enum == 'CUSTOM'
 		sub.prop(self, "scale_length")
 
+		layout.prop( self, "use_bmesh_import" )
+		layout.prop( self, "use_import_cache" )
+
 
 # To support reload properly, try to access a package var.
 # If it's there, reload everything
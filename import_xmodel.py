@@ -18,7 +18,8 @@
 
 # <pep8 compliant>
 
-import os, bpy, bmesh, array, math
+import os, bpy, bmesh, math
+import numpy as np
 from mathutils import *
 from bpy_extras.image_utils import load_image
 from .pv_py_utils.stdlib import *
@@ -80,17 +81,21 @@ def join_armatures(skel1_ob, skel2_ob, skel2_mesh_obs):
 	ebs = skel1_ob.data.edit_bones
 
 	# Reassign all children for any bones that were present in both skeletons
-	for bone in ebs:
-		try:
-			t = ebs[bone.name + ".001"]
-			reassign_children(ebs, bone, t)
-		except:
-			pass
+	# Iterate over the names, since reassign_children() removes the dup bones
+	bone_names = [bone.name for bone in ebs]
+	bone_name_set = set(bone_names)
+	for name in bone_names:
+		if name not in bone_name_set:
+			continue  # Already removed as another bone's duplicate
+
+		dup_name = name + ".001"
+		if dup_name in bone_name_set:
+			reassign_children(ebs, ebs[name], ebs[dup_name])
+			bone_name_set.discard(dup_name)
 
 	# Remove the move the duplicates
-	for bone in ebs:
-		if(bone.name.endswith(".001")):
-			ebs.remove(bone)
+	for bone in [bone for bone in ebs if bone.name.endswith(".001")]:
+		ebs.remove(bone)
 
 	if 'j_gun' in ebs and 'tag_weapon' in ebs:
 		ebs['j_gun'].parent = ebs['tag_weapon']
@@ -114,6 +119,344 @@ def join_armatures(skel1_ob, skel2_ob, skel2_mesh_obs):
 			mod.use_vertex_groups = True
 
 
+def build_mesh_direct(
+		mesh, sub_mesh, target_scale,
+		use_dup_tris = True,
+		use_vertex_colors = True
+	):
+	'''
+	Build `mesh` from `sub_mesh` by filling the mesh data directly with
+	foreach_set(), rather than going through bmesh.
+
+	Returns the normal for each loop & the source vertex for each mesh vert.
+	'''
+	verts = sub_mesh.verts
+	vert_count = len(verts)
+
+	coords = np.fromiter(
+		(c for vert in verts for c in vert.offset),
+		dtype=np.float32,
+		count=vert_count * 3
+	).reshape(-1, 3)
+	coords *= target_scale
+
+	# Corner (face vertex) data for every tri that's going to be added
+	tri_corners = []
+	tri_material_ids = []
+
+	# The vert sets of all of the added tris - bmesh refuses to create a face
+	#  that uses the same verts as an existing one, so that's emulated here
+	tri_keys = set()
+
+	# Contains data for faces that use the same 3 verts as an existing face
+	#  (usually caused by `double sided` tris)
+	dup_faces = []
+	# Indices (into sub_mesh.verts) of the verts that get duplicated
+	dup_vert_indices = []
+
+	# Contains vertex mapping data for all verts that the dup faces use
+	dup_verts_mapping = [None] * vert_count
+
+	for face_index, face in enumerate(sub_mesh.faces):
+		# Fix the winding order
+		i0, i1, i2 = face.indices
+		corners = (i0, i2, i1)
+		key = frozenset(index.vertex for index in corners)
+
+		if len(key) != 3:
+			print("TRI %d is invalid! %s" %
+				  (face_index, [index.vertex for index in corners]))
+			continue
+
+		if key in tri_keys:
+			dup_faces.append((face, corners))
+			continue
+
+		tri_keys.add(key)
+		tri_corners.append(corners)
+		tri_material_ids.append(face.material_id)
+
+	# Loop vertex indices for all of the tris
+	loop_verts = [index.vertex for corners in tri_corners for index in corners]
+
+	if use_dup_tris:
+		for face, corners in dup_faces:
+			dup_indices = []
+			for index in corners:
+				vert = index.vertex
+				if dup_verts_mapping[vert] is None:
+					dup_verts_mapping[vert] = len(dup_vert_indices) + vert_count
+					dup_vert_indices.append(vert)
+				dup_indices.append(dup_verts_mapping[vert])
+
+			key = frozenset(dup_indices)
+			if key in tri_keys:
+				continue  # Skip dups of dups
+
+			tri_keys.add(key)
+			tri_corners.append(corners)
+			tri_material_ids.append(face.material_id)
+			loop_verts.extend(dup_indices)
+
+		# The dup verts are copies of already scaled verts
+		dup_coords = coords[np.asarray(dup_vert_indices, dtype=np.intp)]
+		coords = np.concatenate((coords, dup_coords))
+
+	loops = [index for corners in tri_corners for index in corners]
+	loop_count = len(loops)
+	tri_count = len(tri_corners)
+
+	# Geometry
+	mesh.vertices.add(len(coords))
+	mesh.vertices.foreach_set("co", np.ascontiguousarray(coords).ravel())
+
+	mesh.loops.add(loop_count)
+	mesh.loops.foreach_set(
+		"vertex_index", np.asarray(loop_verts, dtype=np.int32))
+
+	mesh.polygons.add(tri_count)
+	mesh.polygons.foreach_set(
+		"loop_start", np.arange(0, loop_count, 3, dtype=np.int32))
+	# Polygon sizes are derived from the loop starts in 3.6+
+	if bpy.app.version < ( 3, 6, 0 ):
+		mesh.polygons.foreach_set(
+			"loop_total", np.full(tri_count, 3, dtype=np.int32))
+	mesh.polygons.foreach_set(
+		"material_index", np.asarray(tri_material_ids, dtype=np.int32))
+
+	mesh.update(calc_edges=True)
+
+	# UV Coordinates (w/ correction)
+	uvs = np.array([index.uv for index in loops], dtype=np.float32).reshape(-1, 2)
+	uvs[:, 1] = 1.0 - uvs[:, 1]
+	mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs.ravel())
+
+	# Vertex Colors
+	if use_vertex_colors:
+		colors = np.array(
+			[index.color for index in loops], dtype=np.float32).reshape(-1, 4)
+		mesh.vertex_colors.new(name="Color").data.foreach_set(
+			"color", colors.ravel())
+
+	loop_normals = np.array(
+		[index.normal for index in loops], dtype=np.float32).reshape(-1, 3)
+
+	return loop_normals, verts + [verts[index] for index in dup_vert_indices]
+
+
+def build_mesh_bmesh(
+		mesh, sub_mesh, target_scale,
+		use_dup_tris = True,
+		use_vertex_colors = True
+	):
+	'''
+	Build `mesh` from `sub_mesh` using bmesh.
+	Slower than build_mesh_direct(), but kept as a fallback.
+
+	Returns the normal for each loop & the source vertex for each mesh vert.
+	'''
+	bm = bmesh.new()
+
+	# Add UV Layers
+	uv_layer = bm.loops.layers.uv.new("UVMap")
+
+	# Add Vertex Color Layer
+	if use_vertex_colors:
+		vert_color_layer = bm.loops.layers.color.new("Color")
+
+	# Add Verts
+	# All of the vert positions are scaled in a single numpy pass, rather
+	#  than building & scaling a Vector for every vert
+	coords = np.fromiter(
+		(c for vert in sub_mesh.verts for c in vert.offset),
+		dtype=np.float32,
+		count=len(sub_mesh.verts) * 3
+	).reshape(-1, 3)
+	coords *= target_scale
+
+	for co in coords.tolist():
+		bm.verts.new(co)
+	bm.verts.ensure_lookup_table()
+	# Plain list of the bmesh verts - much cheaper to index than bm.verts
+	verts_arr = bm.verts[:]
+
+	# Contains data for faces that use the same 3 verts as an existing face
+	#  (usually caused by `double sided` tris)
+	dup_faces = []
+	# Indices (into sub_mesh.verts) of the verts that get duplicated
+	dup_vert_indices = []
+
+	# Contains vertex mapping data for all verts that the dup faces use
+	dup_verts_mapping = [None] * len(sub_mesh.verts)
+
+	# (bmesh face, source face, corners) for every tri that was added
+	added_tris = []
+	added_tris_append = added_tris.append
+
+	vert_count = len(sub_mesh.verts)
+	for face_index, face in enumerate(sub_mesh.faces):
+		# Fix the winding order
+		# The swapped corners are kept locally so the source face isn't
+		#  modified (& can't be flipped twice)
+		i0, i1, i2 = face.indices
+		corners = (i0, i2, i1)
+
+		indices = [verts_arr[index.vertex] for index in corners]
+
+		try:
+			f = bm.faces.new(indices)
+		except ValueError:
+			if not face.isValid():
+				print("TRI %d is invalid! %s" %
+					  (face_index, [index.vertex for index in corners]))
+				continue
+
+			dup_indices = []
+			for index in corners:
+				vert = index.vertex
+				if dup_verts_mapping[vert] is None:
+					dup_verts_mapping[vert] = len(dup_vert_indices) + vert_count
+					dup_vert_indices.append(vert)
+				dup_indices.append(dup_verts_mapping[vert])
+			dup_faces.append((face, corners, dup_indices))
+		else:
+			added_tris_append((f, face, corners))
+
+	if use_dup_tris:
+		# The dup verts are copies of already scaled verts
+		dup_coords = coords[np.asarray(dup_vert_indices, dtype=np.intp)]
+
+		for co in dup_coords.tolist():
+			bm.verts.new(co)
+		bm.verts.ensure_lookup_table()
+		verts_arr = bm.verts[:]
+
+		for face, corners, dup_indices in dup_faces:
+			indices = [verts_arr[index] for index in dup_indices]
+			try:
+				f = bm.faces.new(indices)
+			except ValueError:
+				pass  # Skip dups of dups
+			else:
+				added_tris_append((f, face, corners))
+
+	# Set up the normals (into loop_normals), uv, materials, etc. for all of
+	#  the added tris, in the same order that they were created
+	loop_normals = []  # List of normals for every added loop (face vertex)
+	loop_normals_append = loop_normals.append
+
+	for f, face, corners in added_tris:
+		# Assign the face's material
+		f.material_index = face.material_id
+
+		for loop, face_index_loop in zip(f.loops, corners):
+			# Normal
+			loop_normals_append(face_index_loop.normal)
+			# UV Coordinate Correction
+			u, v = face_index_loop.uv
+			loop[uv_layer].uv = (u, 1.0 - v)
+			# Vertex Colors
+			if use_vertex_colors:
+				loop[vert_color_layer] = face_index_loop.color
+
+	bm.to_mesh(mesh)
+	bm.free()
+
+	if use_dup_tris:
+		return loop_normals, sub_mesh.verts + [
+			sub_mesh.verts[index] for index in dup_vert_indices]
+	return loop_normals, sub_mesh.verts
+
+
+# Bump this whenever the importer's output changes, to invalidate old caches
+IMPORT_CACHE_VERSION = 2
+
+
+def get_import_cache_path(filepath):
+	return filepath + '.cache.blend'
+
+
+def get_import_cache_key_path(cache_path):
+	# The key is kept in a sidecar file so that it can be checked without
+	#  appending anything from the cache
+	return cache_path + '.key'
+
+
+def load_import_cache(filepath, cache_key, scene):
+	'''
+	Append the objects from the import cache for `filepath` and link them to
+	the scene. Returns None if there's no valid cache for the given key.
+	'''
+	cache_path = get_import_cache_path(filepath)
+	if not os.path.isfile(cache_path):
+		return None
+
+	if os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+		return None
+
+	# Make sure the cache was written with the same import options
+	try:
+		with open(get_import_cache_key_path(cache_path), 'r', encoding='utf-8') as file:
+			if file.read() != cache_key:
+				return None
+	except OSError:
+		return None
+
+	# Materials that already exist get reused by regular imports, so keep
+	#  track of them to do the same for the appended ones
+	old_material_names = set(bpy.data.materials.keys())
+
+	with bpy.data.libraries.load(cache_path, link=False) as (data_from, data_to):
+		data_to.objects = data_from.objects
+		# Append the materials explicitly, so that each appended material
+		#  can be paired with the name it has in the cache
+		cached_material_names = list(data_from.materials)
+		data_to.materials = cached_material_names
+
+	# Any appended material that collided with an existing one got renamed
+	#  (i.e. 'mat' -> 'mat.001'), so swap it for the existing material
+	for name, mat in zip(cached_material_names, data_to.materials):
+		if mat is None or name not in old_material_names:
+			continue
+
+		mat.user_remap(bpy.data.materials[name])
+		bpy.data.materials.remove(mat)
+
+	objs = [obj for obj in data_to.objects if obj is not None]
+	if not objs:
+		return None
+
+	for obj in objs:
+		scene.collection.objects.link(obj)
+
+	return objs
+
+
+def write_import_cache(filepath, cache_key, objs):
+	'''
+	Write the given objects (& everything they use) to the import cache
+	for `filepath`
+	'''
+	cache_path = get_import_cache_path(filepath)
+	key_path = get_import_cache_key_path(cache_path)
+	try:
+		# Invalidate the old cache first, in case writing the new one fails
+		if os.path.isfile(key_path):
+			os.remove(key_path)
+
+		# No fake users, so that appended models can be deleted like
+		#  regular imports (the objects are passed explicitly anyway)
+		bpy.data.libraries.write(
+			cache_path, set(objs),
+			path_remap='ABSOLUTE'
+		)
+
+		with open(key_path, 'w', encoding='utf-8') as file:
+			file.write(cache_key)
+	except OSError as e:
+		print("Failed to write the import cache '%s': %s" % (cache_path, e))
+
+
 def load(
 		self,
 		context,
@@ -134,11 +477,8 @@ def load(
 
 	target_scale = global_scale
 
-	if use_armature == false:
-		attach_model = False
-
 	skel_old = get_armature_for_object(context.active_object)
-	if skel_old is None:
+	if not use_armature or skel_old is None:
 		attach_model = False
 
 	if not attach_model:
@@ -146,10 +486,35 @@ def load(
 
 	split_meshes = not use_single_mesh
 	load_images = True
+	use_bmesh = shared.plugin_preferences.use_bmesh_import
 
 	scene = bpy.context.scene
 	view_layer = bpy.context.view_layer
 
+	# Bind the bpy lookups that are used repeatedly below
+	objs_link = scene.collection.objects.link
+	objs_new = bpy.data.objects.new
+	meshes_new = bpy.data.meshes.new
+	data_images = bpy.data.images
+	mode_set = bpy.ops.object.mode_set
+
+	# Attaching modifies existing objects in the scene, so those imports
+	#  can't be cached
+	use_cache = shared.plugin_preferences.use_import_cache and not attach_model
+	if use_cache:
+		cache_key = repr((
+			IMPORT_CACHE_VERSION, target_scale, use_single_mesh, use_dup_tris,
+			use_custom_normals, use_vertex_colors, use_armature,
+			self.use_parents, use_bmesh
+		))
+
+		cached_objs = load_import_cache(filepath, cache_key, scene)
+		if cached_objs is not None:
+			# Match the active object of a regular import
+			armatures = [obj for obj in cached_objs if obj.type == 'ARMATURE']
+			view_layer.objects.active = (armatures or cached_objs)[-1]
+			return
+
 	# Load the model
 	model_name = os.path.basename(filepath)
 	model = XModel.Model(('.').join(model_name.split('.')[:-1]))
@@ -191,11 +556,10 @@ def load(
 			for image_type, image_name in material.images.items():
 				if image_name not in material_images:
 					search_dir = os.path.dirname(filepath)
-					image = load_image(
+					image = shared.load_image_cached(
 						image_name,
-						dirname=search_dir,
-						recursive=use_image_search,
-						check_existing=True
+						search_dir,
+						recursive=use_image_search
 					)
 					if image is None:
 						print("Failed to load image: '%s'" % image_name)
@@ -209,154 +573,58 @@ def load(
 							place_holder=True
 						)
 					material_images[image_name] = image
-				elif image_name in bpy.data.images:
-					image = bpy.data.images[image_name]
+				elif image_name in data_images:
+					image = data_images[image_name]
 				else:
 					image = material_images[image_name]
 		
 		materials.append(mat)
 
+	# Build a material_id to Blender image map
+	# This only depends on the model's materials, so it's shared by all meshes
+	if load_images:
+		material_image_map = [None] * len(model.materials)
+		for index, material in enumerate(model.materials):
+			if 'color' in material.images:
+				color_map = material.images['color']
+				if color_map in data_images:
+					material_image_map[index] = data_images[color_map]
+
 	# Meshes
 	mesh_objs = []  # Mesh objects that we're going to link the skeleton to
 	for sub_mesh in model.meshes:
 		if split_meshes is False:
 			sub_mesh.name = "%s_mesh" % model.name
 		#print("Creating mesh: '%s'" % sub_mesh.name)
-		mesh = bpy.data.meshes.new(sub_mesh.name)
-		bm = bmesh.new()
-
-		# Add UV Layers
-		uv_layer = bm.loops.layers.uv.new("UVMap")
-
-		# Add Vertex Color Layer
-		if use_vertex_colors:
-			vert_color_layer = bm.loops.layers.color.new("Color")
-
-		# Add Verts
-		for vert in sub_mesh.verts:
-			bm.verts.new(Vector(vert.offset) * target_scale)
-		bm.verts.ensure_lookup_table()
-
-		# Contains data for faces that use the same 3 verts as an existing face
-		#  (usually caused by `double sided` tris)
-		dup_faces = []
-		dup_verts = []
-
-		# Contains vertex mapping data for all verts that the dup faces use
-		dup_verts_mapping = [None] * len(sub_mesh.verts)
-
-		used_faces = []  # List of all faces that were used in the model
-
-		loop_normals = []  # List of normals for every added loop (face vertex)
-
-		# Tracks how many faces in the current mesh use a given material
-		material_usage_counts = [0] * len(materials)
-
-		# Inner function used set up a bmesh tri's normals (into loop_normals),
-		#  uv, materials, etc.
-		def setup_tri(f):
-			# Assign the face's material & increment the material usage counter
-			material_index = face.material_id
-			f.material_index = material_index
-
-			material_usage_counts[material_index] += 1
-
-			# Assign the face's UV layer
-			for loop_index, loop in enumerate(f.loops):
-				face_index_loop = face.indices[loop_index]
-				# Normal
-				loop_normals.append(face_index_loop.normal)
-				# UV Coordinate Correction
-				uv = Vector(face_index_loop.uv)
-				uv.y = 1.0 - uv.y
-				loop[uv_layer].uv = uv
-				# Vertex Colors
-				if use_vertex_colors:
-					loop[vert_color_layer] = face_index_loop.color
-
-			used_faces.append(face)
+		mesh = meshes_new(sub_mesh.name)
 
-		unused_faces = []
-
-		vert_count = len(sub_mesh.verts)
-		for face_index, face in enumerate(sub_mesh.faces):
-			# Fix the winding order
-			tmp = face.indices[2]
-			face.indices[2] = face.indices[1]
-			face.indices[1] = tmp
+		if use_bmesh:
+			build_mesh = build_mesh_bmesh
+		else:
+			build_mesh = build_mesh_direct
 
-			indices = [bm.verts[index.vertex] for index in face.indices]
+		loop_normals, mesh_verts = build_mesh(
+			mesh, sub_mesh, target_scale,
+			use_dup_tris=use_dup_tris,
+			use_vertex_colors=use_vertex_colors
+		)
 
-			try:
-				f = bm.faces.new(indices)
-			except ValueError:
-				# Mark the face as unused
-				unused_faces.append(face)
-
-				if not face.isValid():
-					print("TRI %d is invalid! %s" %
-						  (face_index, [index.vertex for index in face.indices]))
-					continue
-
-				for index in face.indices:
-					vert = index.vertex
-					if dup_verts_mapping[vert] is None:
-						dup_verts_mapping[vert] = len(dup_verts) + vert_count
-						dup_verts.append(sub_mesh.verts[vert])
-					index.vertex = dup_verts_mapping[vert]
-				dup_faces.append(face)
-			else:
-				setup_tri(f)
-
-		# Remove the unused tris so they aren't accidentally used later
-		for face in unused_faces:
-			sub_mesh.faces.remove(face)
-
-		if use_dup_tris:
-			for vert in dup_verts:
-				bm.verts.new(Vector(vert.offset) * target_scale)
-			bm.verts.ensure_lookup_table()
-
-			for face in dup_faces:
-				indices = [bm.verts[index.vertex] for index in face.indices]
-				try:
-					f = bm.faces.new(indices)
-				except ValueError:
-					pass  # Skip dups of dups
-				else:
-					setup_tri(f)
+		# Assign Materials
+		# Only the materials that are used by this mesh's faces are added,
+		#  so the face material indices are remapped to match
+		material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+		mesh.polygons.foreach_get("material_index", material_indices)
 
-		# Vertex Weights
-		deform_layer = bm.verts.layers.deform.new()
-		for vert_index, vert in enumerate(sub_mesh.verts):
-			for bone, weight in vert.weights:
-				bm.verts[vert_index][deform_layer][bone] = weight
+		used_materials = np.flatnonzero(
+			np.bincount(material_indices, minlength=len(materials)))
+		material_remap = np.zeros(len(materials), dtype=np.int32)
+		material_remap[used_materials] = np.arange(len(used_materials))
 
-		if use_dup_tris:
-			offset = len(sub_mesh.verts)
-			for vert_index, vert in enumerate(dup_verts):
-				for bone, weight in vert.weights:
-					bm.verts[vert_index + offset][deform_layer][bone] = weight
+		mesh.polygons.foreach_set(
+			"material_index", material_remap[material_indices])
 
-		# Assign Materials
-		for mat in materials:
-			mesh.materials.append(mat)
-
-		bm.to_mesh(mesh)
-
-		# For this mesh remove all materials that aren't used by its faces
-		# material_index, material_usage_index must be tracked manually because
-		# enumerate() doesn't compensate for the removed materials properly
-		material_index = 0
-		material_usage_index = 0
-		for material in mesh.materials:
-			if material_usage_counts[material_usage_index] == 0:
-				# Note: update_data must be True, otherwise - after the first
-				#  material is removed, the indices are invalidated
-				mesh.materials.pop(index=material_index)
-			else:
-				material_index += 1
-			material_usage_index += 1
+		for material_index in used_materials:
+			mesh.materials.append(materials[material_index])
 
 		# Custom Normals
 		if use_custom_normals:
@@ -389,20 +657,19 @@ def load(
 			# Enable Smoothing - must be BEFORE normals_split_custom_set, etc.
 			# ... Moved this *above* definition & application of `clnors`
 			# ( even though it doesn't seem to do anything ) - pv
-			mesh.polygons.foreach_set( "use_smooth", [ True ] * len( mesh.polygons ) )
+			mesh.polygons.foreach_set( "use_smooth", np.ones( len( mesh.polygons ), dtype=bool ) )
 
-			clnors = array.array( 'f', [ .0 ] * ( len( loop_normals ) * 3 ) )
-			for i, normal in enumerate( loop_normals ):
-				clnors[ i * 3 + 0 ] = normal[ 0 ]
-				clnors[ i * 3 + 1 ] = normal[ 1 ]
-				clnors[ i * 3 + 2 ] = normal[ 2 ]
+			# Stack the loop normals into an (N, 3) array in one go, rather
+			#  than copying them component by component
+			# (the direct builder already returns them as one - so no copy)
+			clnors = np.asarray( loop_normals, dtype=np.float32 ).reshape( -1, 3 )
 
-			mesh.normals_split_custom_set( tuple( zip( *( iter( clnors ), ) * 3 ) ) )
+			mesh.normals_split_custom_set( clnors.tolist() )
 		else:
 			mesh.validate()
 
 			# Enable Smoothing
-			mesh.polygons.foreach_set( "use_smooth", [ True ] * len( mesh.polygons ) )
+			mesh.polygons.foreach_set( "use_smooth", np.ones( len( mesh.polygons ), dtype=bool ) )
 
 			# Use Auto-generated Normals
 			if bpy.app.version < ( 4, 0, 0 ):
@@ -414,27 +681,41 @@ def load(
 			obj_name = model.name
 
 		# Create the model object and link it to the scene
-		obj = bpy.data.objects.new( obj_name, mesh )
+		obj = objs_new( obj_name, mesh )
 		mesh_objs.append(obj)
 
-		scene.collection.objects.link( obj )
-		view_layer.objects.active = obj
+		objs_link( obj )
 
 		# Create Vertex Groups
-		# These automatically weight the verts based on the deform groups
-		for bone in model.bones:
+		vertex_groups = [
 			obj.vertex_groups.new( name=bone.name.lower() )
+			for bone in model.bones
+		]
+
+		# Vertex Weights
+		# Bucket the verts by bone & weight so that each bucket can be
+		#  assigned with a single VertexGroup.add() call
+		weight_buckets = {}
+		for vert_index, vert in enumerate( mesh_verts ):
+			for bone, weight in vert.weights:
+				weight_buckets.setdefault( ( bone, weight ), [] ).append( vert_index )
+
+		bad_bones = set()
+		for ( bone, weight ), vert_indices in weight_buckets.items():
+			# Skip the weights for bones that the model doesn't have
+			if not 0 <= bone < len( vertex_groups ):
+				bad_bones.add( bone )
+				continue
+			vertex_groups[ bone ].add( vert_indices, weight, 'REPLACE' )
+
+		if bad_bones:
+			shared.add_warning(
+				f"Mesh '{mesh.name}' has weights for bone indices that don't exist "
+				f"in the model ({ ', '.join( map( str, sorted( bad_bones ) ) ) }) - they were skipped"
+			)
 
 		# Assign the texture images to the current mesh (for Texture view)
 		if load_images:
-			# Build a material_id to Blender image map
-			material_image_map = [None] * len(model.materials)
-			for index, material in enumerate(model.materials):
-				if 'color' in material.images:
-					color_map = material.images['color']
-					if color_map in bpy.data.images:
-						material_image_map[index] = bpy.data.images[color_map]
-
 			# DEPRECATED
 			'''
 			# Assign the image for each face
@@ -443,39 +724,48 @@ def load(
 				uv_faces[index].image = material_image_map[face.material_id]
 			'''
 
+	# Only the last mesh object needs to be made active
+	if mesh_objs:
+		view_layer.objects.active = mesh_objs[-1]
+
 	if use_armature:
 		# Create the skeleton
 		armature = bpy.data.armatures.new("%s_amt" % model.name)
 		armature.display_type = "STICK"
 
-		skel_obj = bpy.data.objects.new("%s_skel" % model.name, armature)
+		skel_obj = objs_new("%s_skel" % model.name, armature)
 		skel_obj.show_in_front = True
 
 		# Add the skeleton object to the scene
-		scene.collection.objects.link(skel_obj)
+		objs_link(skel_obj)
 		view_layer.objects.active = skel_obj
 
-		bpy.ops.object.mode_set(mode='EDIT')
+		mode_set(mode='EDIT')
+
+		ebs = armature.edit_bones
+		# Edit bones in the same order as model.bones, for the parent lookups
+		created = []
+		use_parents = self.use_parents is True
+		s = target_scale
 
 		for bone in model.bones:
-			edit_bone = armature.edit_bones.new(bone.name.lower())
+			edit_bone = ebs.new(bone.name.lower())
 			edit_bone.use_local_location = False
 
-			offset = Vector(bone.offset) * target_scale
-			axis = Vector(bone.matrix[1]) * target_scale
-			roll = Vector(bone.matrix[2])
+			ox, oy, oz = bone.offset
+			ax, ay, az = bone.matrix[1]
+			head = (ox * s, oy * s, oz * s)
 
-			edit_bone.head = offset
-			edit_bone.tail = offset + axis
-			edit_bone.align_roll(roll)
+			edit_bone.head = head
+			edit_bone.tail = (head[0] + ax * s, head[1] + ay * s, head[2] + az * s)
+			edit_bone.align_roll(bone.matrix[2])
+			created.append(edit_bone)
 
-			if bone.parent != -1:
-				parent = armature.edit_bones[bone.parent]
-				if self.use_parents is True:
-					edit_bone.parent = parent
+			if bone.parent != -1 and use_parents:
+				edit_bone.parent = created[bone.parent]
 
 		# HACK: Force the pose bone list for the armature to be rebuilt
-		bpy.ops.object.mode_set(mode='OBJECT')
+		mode_set(mode='OBJECT')
 
 		# Add the armature modifier to each mesh object
 		for mesh_obj in mesh_objs:
@@ -498,32 +788,40 @@ def load(
 				arm_is_active = False
 			"""
 
+			root_name = skel_obj.pose.bones[0].name
+			old_bones = skel_old.pose.bones
+			old_names = set(old_bones.keys())
+
 			if attach_model:
 				skel_obj.parent = skel_old
-			if skel_obj.pose.bones[0].name == "j_gun":
+			if root_name == "j_gun":
 				skel_obj.parent_bone = "tag_weapon"
-			elif skel_obj.pose.bones[0].name == "tag_weapon":
+			elif root_name == "tag_weapon":
 				 # Todo - add option to manually specify whether or not the user
 				 #        wants to attach to the left or right hand
 				skel_obj.parent_bone = "tag_weapon_right"
 			else:
-				if skel_obj.pose.bones[0].name in skel_old.pose.bones:
-					skel_obj.parent_bone = skel_obj.pose.bones[0].name
+				if root_name in old_names:
+					skel_obj.parent_bone = root_name
 				else:
 					print(("Warning: Armature '%s' may not"
 						   "merge correctly with '%s'") %
 						  (skel_obj.name, skel_old.name))
-					skel_obj.parent_bone = skel_old.pose.bones[0].name
+					skel_obj.parent_bone = old_bones[0].name
 			skel_obj.parent_type = 'BONE'
 			skel_obj.location = (0, -1, 0)
 
 			# Is this necessary?
-			bpy.context.view_layer.update()
+			view_layer.update()
 
 			# Merge the skeletons together
 			if merge_skeleton:
 				join_armatures(skel_old, skel_obj, mesh_objs)
-				bpy.ops.object.mode_set(mode='POSE')
+				mode_set(mode='POSE')
 
 	# view_layer.update()
-	bpy.ops.object.mode_set(mode='OBJECT')
+	mode_set(mode='OBJECT')
+
+	if use_cache:
+		cached_objs = mesh_objs + [skel_obj] if use_armature else mesh_objs
+		write_import_cache(filepath, cache_key, cached_objs)
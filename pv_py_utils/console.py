@@ -147,27 +147,31 @@ units_of_time = (
 	( 'ns',		10**-9	)
 )
 
+# units_of_time in integer nanoseconds, so timef() can work on exact ints
+units_of_time_ns = tuple( ( name, round( count * 10**9 ) ) for name, count in units_of_time )
+
 def timef( _secs: float, granularity = 2 ):
 	"""Formats the given time from seconds into a readable string.
 
 	E.g.:
 	- 180 (w/ a granularity of 2) would return "3 mins"
 	- 192.152 (w/ a granularity of 2) would return "3 mins, 12 secs"
-	- 192.152 (w/ a granularity of 3) would return "3 mins, 12 secs, 151 ms"
+	- 192.152 (w/ a granularity of 3) would return "3 mins, 12 secs, 152 ms"
 	- 4825 (w/ a granularity of 2) would return "1 hour, 20 mins"
 	- 4825 (w/ a granularity of 3) would return "1 hour, 20 mins, 25 secs"
 	"""
 	if not _secs: return "0 secs"
 
 	result = []
+	_ns = round( _secs * 10**9 )
 
-	for name, count in units_of_time:
-		value = _secs // count
+	for name, count in units_of_time_ns:
+		value, _ns = divmod( _ns, count )
 		if value:
-			_secs -= value * count
-			if value == 1 and count >= 1:
+			if value == 1 and count >= 10**9:
 				name = name.rstrip( 's' )
-			result.append( f"{int( value )} {name}" )
+			result.append( f"{value} {name}" )
+			if len( result ) == granularity: break
 	
 	return ', '.join( result[ :granularity ] )
 
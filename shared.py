@@ -18,12 +18,20 @@
 
 # <pep8 compliant>
 
-import subprocess, sys, bpy, datetime
+import subprocess, sys, os, bpy, datetime
+from collections import deque
+from bpy_extras.image_utils import load_image
 from .pv_py_utils import console
 from .pv_py_utils.stdlib import *
 
 plugin_preferences = None
-warning_messages: list[ str ] = []
+# Capped so that a huge batch import can't pile up an unbounded amount of them
+#  (every warning is still printed to the console)
+warning_messages: deque[ str ] = deque( maxlen = 10000 )
+
+# Recursive listings of the image search dirs, keyed by the search dir
+#  Each listing maps a lower-cased file name to its full path
+image_dir_cache: dict[ str, dict[ str, str ] ] = {}
 
 def get_metadata_string( filepath ):
 	msg = f"Exported with pv_blender_cod using Blender {bpy.app.version_string}\n"
@@ -46,6 +54,61 @@ def calculate_unit_scale_factor( scene ):
 	return scale
 
 
+def scan_image_dir( search_dir ):
+	"""(Re)builds the recursive listing of `search_dir` in `image_dir_cache`"""
+	listing = {}
+	for root, _, files in os.walk( search_dir ):
+		for file in files:
+			listing.setdefault( file.lower(), os.path.join( root, file ) )
+
+	image_dir_cache[ search_dir ] = listing
+	return listing
+
+
+def find_image_path( image_name, search_dir ):
+	"""Searches the subdirs of `search_dir` for `image_name` & returns its
+	absolute path, or `None` if it can't be found.
+
+	The listing of each search dir is cached, and only rescanned when
+	a name can't be found in it.
+	"""
+	file_name = os.path.basename( image_name.replace( '\\', '/' ) ).lower()
+
+	listing = image_dir_cache.get( search_dir )
+	if listing is not None:
+		path = listing.get( file_name )
+		if path is not None and os.path.isfile( path ):
+			return os.path.abspath( path )
+
+	# Not scanned yet, or the dir has changed since - rescan it once
+	path = scan_image_dir( search_dir ).get( file_name )
+	return None if path is None else os.path.abspath( path )
+
+
+def load_image_cached( image_name, search_dir, recursive = True ):
+	"""Same as `load_image()`, but the recursive search of `search_dir` uses
+	a cached listing so repeated imports from the same dir don't walk it again.
+	"""
+	# Try load_image()'s own lookups first (native path separators, the
+	# file name in `search_dir`, case-insensitive names, etc.), which is the
+	# same order load_image() uses before falling back to a recursive search
+	image = load_image(
+		image_name,
+		dirname = search_dir,
+		recursive = False,
+		check_existing = True
+	)
+	if image is not None or not recursive:
+		return image
+
+	path = find_image_path( image_name, search_dir )
+	if path is None:
+		return None
+
+	# check_existing reuses any image that's already loaded from this path
+	return load_image( path, check_existing = True )
+
+
 def raise_error( msg ):
 	class ErrorOperator( bpy.types.Operator ):
 		bl_idname = "wm.error_operator"
@@ -101,13 +164,11 @@ class PV_OT_message_list_popup( bpy.types.Operator ):
 
 
 def show_warnings():
-	global warning_messages
-
 	# Only show dialog if there are messages to show
-	if not warning_messages.__len__(): return
+	if not warning_messages: return
 
 	msg_str = "\n".join( warning_messages )
-	warning_messages = []
+	warning_messages.clear()
 	# print( "[ DEBUG ] Showing warnings dialog..." )
 	print()
 	bpy.ops.wm.pv_message_list_popup( 'INVOKE_DEFAULT', messages = msg_str )
@@ -115,7 +176,5 @@ def show_warnings():
 
 def add_warning( _msg: str ):
 	console.warning( _msg )
-	
-	global warning_messages
 	warning_messages.append( '--> ' + _msg )
 